@@ -1,21 +1,38 @@
 import asyncio
+import functools
+import logging
+import re
+from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+import fastexcel
 import polars as pl
 import polars.selectors as cs
 from attr import dataclass
-from polars import DataFrame
+from polars import DataFrame, LazyFrame
 
 from custom_components.dominion_energy import LOGGER
 from custom_components.dominion_energy.models import BillSummary
 from custom_components.dominion_energy.models.attributes import Columns
 
+# Time of day in a reading column name (e.g. '12:00 AM' from '12:00 AM kW')
+TIME_OF_DAY_PATTERN = re.compile(r"(\d+:\d+ [AP]M)")
+
+ENERGY_SHEET = "kWH Usage Data"
+POWER_SHEET = "kW Usage Data"
+
+
+@functools.lru_cache(maxsize=8)
+def _zone_info(timezone: str) -> ZoneInfo:
+    """ZoneInfo for a timezone name, shared by every processor since HA uses a single zone."""
+    return ZoneInfo(timezone)
+
 
 @dataclass(frozen=True)
 class RawUsageData:
-    power_df: pl.DataFrame
-    energy_df: pl.DataFrame
+    power_df: pl.LazyFrame
+    energy_df: pl.LazyFrame
 
 class DominionDataProcessor:
     tzinfo: ZoneInfo
@@ -27,14 +44,38 @@ class DominionDataProcessor:
     ):
         self.file_path = file_path
         self.timezone = timezone
-        self.tzinfo = ZoneInfo(timezone)
+        self.tzinfo = _zone_info(timezone)
+        self._sheets: dict[str, DataFrame] | None = None
+
+    async def source_digest(self) -> str:
+        """
+        Digest of the parsed workbook, used to detect an unchanged download.
+        The portal builds a new file with its own timestamps on every request, so the
+        readings are compared rather than the file bytes. The sheets stay loaded for processing.
+        """
+        sheets = await self._validate_excel_sheets()
+        return "|".join(
+            f"{sheet_name}:{sheet.height}:{sheet.hash_rows().sum()}"
+            for sheet_name, sheet in sorted(sheets.items())
+        )
+
+    def _load_excel_sheets_sync(self) -> dict[str, DataFrame]:
+        # The calamine reader borrows itself mutably per load, so sheets are loaded one after the other
+        reader = fastexcel.read_excel(str(self.file_path))
+        return {
+            sheet_name: reader.load_sheet(sheet_name).to_polars()
+            for sheet_name in reader.sheet_names
+        }
+
+    async def _load_excel_sheets(self) -> dict[str, DataFrame]:
+        """Load every sheet of the workbook with fastexcel's calamine reader, off the event loop, once."""
+        if self._sheets is None:
+            self._sheets = await asyncio.get_running_loop().run_in_executor(None, self._load_excel_sheets_sync)
+        return self._sheets
 
     async def _validate_excel_sheets(self) -> dict[str, DataFrame]:
         try:
-            sheets: dict[str, DataFrame] = await asyncio.get_running_loop().run_in_executor(
-                None,
-                lambda: pl.read_excel(self.file_path, sheet_id=0)
-            )
+            sheets: dict[str, DataFrame] = await self._load_excel_sheets()
             sheet_names = list(sheets.keys())
 
             if len(sheet_names) < 2:
@@ -50,7 +91,7 @@ class DominionDataProcessor:
     async def _read_excel_sheets(self) -> RawUsageData:
         """
         Reads power and energy sheets from Excel file
-        :return: RawUsage data containing both data frames
+        :return: RawUsage data containing both sheets as lazy frames
         :raise: Exception if file cannot be read or expected sheets not found.
         """
         try:
@@ -60,23 +101,16 @@ class DominionDataProcessor:
                 pl.col("Date")
                 .str.to_date(format="%m/%d/%Y")
             )
-            total_column = (
-                pl.sum_horizontal(cs.contains("kW")).alias("Total")
-            )
 
-            energy_df: DataFrame = (
-                sheets.get("kWH Usage Data")
-                .with_columns(
-                    date_column,
-                    total_column
-                )
+            energy_df: LazyFrame = (
+                sheets.get(ENERGY_SHEET)
+                .lazy()
+                .with_columns(date_column)
             )
-            power_df: DataFrame = (
-                sheets.get("kW Usage Data")
-                .with_columns(
-                    date_column,
-                    total_column
-                )
+            power_df: LazyFrame = (
+                sheets.get(POWER_SHEET)
+                .lazy()
+                .with_columns(date_column)
             )
 
             return RawUsageData(
@@ -86,27 +120,22 @@ class DominionDataProcessor:
 
 
         except Exception as exception:
-            print(f"Failed to read Excel file {self.file_path}: {str(exception)}")
+            LOGGER.error("Failed to read Excel file %s: %s", self.file_path, str(exception))
             raise
 
     def _clean(self, data: RawUsageData)-> RawUsageData:
-        def drop_incomplete_dates(df: DataFrame)-> DataFrame:
+        def drop_incomplete_dates(df: LazyFrame)-> LazyFrame:
             """Drop the latest date if it's incomplete (all PM values are zero)"""
-            latest_date = df.select(pl.col("Date").max()).item()
+            is_latest_date = pl.col("Date") == pl.col("Date").max()
 
             is_incomplete = (
-                df
-                .filter(pl.col("Date") == pl.col("Date").max())  # Get latest date
-                .select(cs.contains(" PM"))  # Select PM columns Afternoon times will not be zero when full data is out
-                .sum_horizontal().item() == 0
+                # Afternoon times will not be zero when full data is out
+                pl.sum_horizontal(cs.contains(" PM"))
+                .sum()
+                .over("Date") == 0
             )
 
-
-            return (
-                df.filter(pl.col("Date") != latest_date)
-                if is_incomplete
-                else df
-            )
+            return df.filter(~(is_latest_date & is_incomplete))
         try:
             clean_power_df = (
                 data.power_df
@@ -123,41 +152,91 @@ class DominionDataProcessor:
                 energy_df=clean_energy_df
             )
         except Exception as exception:
-            print(f"Error cleaning data: {str(exception)}")
-        raise
+            LOGGER.error("Error cleaning data: %s", str(exception))
+            raise
 
-    def _transform_to_long_format(self, df: DataFrame, value_col_name: str) -> DataFrame:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _minutes_since_midnight(column: str) -> int:
+        """
+        Parse the time of day from a reading column name into minutes since midnight.
+        The sheet columns are the same on every download, so results are cached across processors.
+        """
+        time_of_day = datetime.strptime(
+            TIME_OF_DAY_PATTERN.search(column).group(1),
+            "%I:%M %p"
+        )
+        return time_of_day.hour * 60 + time_of_day.minute
+
+    def _columns_by_minutes(self, df: LazyFrame) -> dict[int, str]:
+        """Map minutes since midnight to the reading column for that time of day."""
+        # Get time columns (excluding Date)
+        time_cols = df.select(
+            cs.contains("AM", "PM")
+        ).collect_schema().names()
+
+        # Column names are a fixed set of half-hour labels, so parse each one once
+        return {
+            self._minutes_since_midnight(column): column
+            for column in time_cols
+        }
+
+    def _transform_to_long_format(self, data: RawUsageData) -> LazyFrame:
         """
-        Convert wide format (columns for each time) to long format with timestamp column.
+        Convert the wide format sheets (columns for each time) to a single long format frame
+        with timestamp, power_kw and energy_kwh columns.
+        Both sheets are joined on Date while still wide, so no join over the long data is needed,
+        and each time of day becomes a slim frame that is concatenated rather than unpivoted.
         Args:
-            df: Wide format DataFrame with DST-aware dates
-            value_col_name: Name for the value column (e.g. 'power_kw' or 'energy_kwh')
+            data: Wide format power and energy LazyFrames with DST-aware dates
         """
         try:
-            # Get time columns (excluding Date and Total)
-            time_cols = df.select(
-                cs.contains("AM", "PM")
-            ).columns
+            power_columns = self._columns_by_minutes(data.power_df)
+            energy_columns = self._columns_by_minutes(data.energy_df)
 
-            return (
-                df
-                .unpivot(
-                    index=["Date"],
-                    on=time_cols,
-                    variable_name="time_str",
-                    value_name=value_col_name
-                )
-                .with_columns([
-                    # Extract time from column name (e.g. '12:00 AM' from '12:00 AM kW')
-                    pl.col("time_str").str.extract(r"(\d+:\d+ [AP]M)").alias("time"),
+            # Line up the power and energy columns for each time of day
+            minutes = sorted(power_columns.keys() & energy_columns.keys())
+
+            # Both sheets can use the same time of day headers, keep them apart through the join
+            power_names = {minute: f"{power_columns[minute]}_kw" for minute in minutes}
+            energy_names = {minute: f"{energy_columns[minute]}_kwh" for minute in minutes}
+
+            wide_df = (
+                data.power_df
+                .select([
+                    "Date",
+                    *(pl.col(power_columns[minute]).alias(power_names[minute]) for minute in minutes)
                 ])
-                .with_columns([
-                    # Combine and parse timestamp - Date already has timezone info
-                    pl.concat_str(["Date", "time"], separator=" ")
-                    .str.strptime(pl.Datetime, format="%Y-%m-%d %I:%M %p")
-                    .alias("timestamp")
+                .join(
+                    data.energy_df.select([
+                        "Date",
+                        *(pl.col(energy_columns[minute]).alias(energy_names[minute]) for minute in minutes)
+                    ]),
+                    on="Date",
+                    how="inner"
+                )
+                # Cast while there is still one row per day, before the frame is expanded
+                .with_columns(
+                    pl.col("Date").cast(pl.Datetime).alias("day_start")
+                )
+            )
+
+            # One slim frame per time of day stacked vertically, instead of an unpivot
+            readings = [
+                wide_df.select([
+                    # Offset the date by the time of day of the reading column
+                    (
+                        pl.col("day_start")
+                        + pl.duration(minutes=minute)
+                    ).alias("timestamp"),
+                    pl.col(power_names[minute]).alias("power_kw"),
+                    pl.col(energy_names[minute]).alias("energy_kwh"),
                 ])
-                .drop(["Date", "time_str", "time"])
+                for minute in minutes
+            ]
+
+            return (
+                pl.concat(readings, how="vertical_relaxed")
                 .sort("timestamp")
             )
 
@@ -165,10 +244,13 @@ class DominionDataProcessor:
             LOGGER.error("Error transforming to long format: %s", str(exception))
             raise
 
-    def _handle_dst(self, df: DataFrame) -> DataFrame:
-        """Handle DST for a DataFrame with complete timestamps."""
+    def _handle_dst(self, df: LazyFrame) -> LazyFrame:
+        """
+        Handle DST for a LazyFrame with complete timestamps.
+        Timestamps that don't exist (spring forward) are left as null.
+        """
         try:
-            dst_df = (
+            return (
                 df
                 .with_columns([
                     pl.col("timestamp")
@@ -181,20 +263,22 @@ class DominionDataProcessor:
                 ])
             )
 
-            # Log any missing timestamps from DST
-            if dst_df.get_column("timestamp").null_count() > 0:
-                missing_times = (
-                    dst_df
-                    .filter(pl.col("timestamp").is_null())
-                    .select(["timestamp"])
-                )
-                LOGGER.debug(f"Missing timestamps during DST transitions:\n{missing_times}")
+        except Exception as exception:
+            LOGGER.error(f"Error handling DST transitions: {str(exception)}")
+            raise
 
-            final_df = dst_df.filter(pl.col("timestamp").is_not_null())
+    def _drop_missing_timestamps(self, dst_df: DataFrame) -> DataFrame:
+        """Drop rows whose timestamp could not be localized during DST handling."""
+        try:
+            final_df = dst_df.drop_nulls("timestamp")
 
-            if final_df.height != df.height:
+            # Log any timestamps lost to DST transitions
+            lost_rows = dst_df.height - final_df.height
+            if lost_rows > 0:
                 LOGGER.warning(
-                    f"Some timestamps were lost during DST transition handling. Original rows: {df.height}, Final rows: {final_df.height}"
+                    "Some timestamps were lost during DST transition handling. Original rows: %s, Lost rows: %s",
+                    dst_df.height,
+                    lost_rows
                 )
 
             return final_df
@@ -206,43 +290,34 @@ class DominionDataProcessor:
     async def process_for_entities(self) -> DataFrame:
         """
         Process data into format suitable for Home Assistant entities
-        Returns DataFrame with columns: timestamp, power_kw, energy_kwh
+        Returns DataFrame with columns: timestamp, power_kw, energy_kwh, date
         """
         try:
             raw_data = await self._read_excel_sheets()
             clean_data = self._clean(raw_data)
 
-            # Transform both power and energy data to long format
-            power_long = self._transform_to_long_format(
-                clean_data.power_df,
-                "power_kw"
-            )
-            energy_long = self._transform_to_long_format(
-                clean_data.energy_df,
-                "energy_kwh"
+            # Transform power and energy data to a single long format frame
+            long_df = self._transform_to_long_format(clean_data)
+
+            entity_plan = (
+                self._handle_dst(long_df)
+                # Sensors group readings by local day, derive it once for all of them
+                .with_columns(pl.col(Columns.TIMESTAMP).dt.date().alias(Columns.DATE))
             )
 
-            # Join power and energy data
-            joined_df = (
-                power_long
-                .join(
-                    energy_long,
-                    on="timestamp",
-                    how="inner"
+            # Polars runs the plan multithreaded without the GIL, keep it off the event loop
+            dst_df: DataFrame = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    entity_plan.collect,
+                    streaming=True
                 )
-                .select([
-                    "timestamp",
-                    "power_kw",
-                    "energy_kwh"
-                ])
             )
 
-            dst_df = self._handle_dst(joined_df)
-
-            return dst_df
+            return self._drop_missing_timestamps(dst_df)
 
         except Exception as exception:
-            print(f"Failed to process data for entities: {str(exception)}")
+            LOGGER.error("Failed to process data for entities: %s", str(exception))
             raise
 
     def process_for_statistics(self, data: DataFrame) -> DataFrame:
@@ -251,22 +326,12 @@ class DominionDataProcessor:
         Combines both the :00 and :30 readings into a single hourly value.
         """
 
-        def _validate_hourly_aggregation(hourly_df: DataFrame, full_df: DataFrame) -> None:
+        def _validate_hourly_aggregation(energy_sums: DataFrame) -> None:
             """
             Validate that hourly aggregation preserves total energy.
             Compares sum before and after aggregation to ensure no data is lost.
             """
-            original_sum = (
-                full_df
-                .get_column(Columns.ENERGY_KWH)
-                .sum()
-            )
-
-            hourly_sum = (
-                hourly_df
-                .get_column(Columns.ENERGY_KWH)
-                .sum()
-            )
+            original_sum, hourly_sum = energy_sums.row(0)
 
             # Allow for small floating point differences
             if abs(original_sum - hourly_sum) > 0.001:
@@ -278,25 +343,35 @@ class DominionDataProcessor:
 
         try:
             # Calculate hourly statistics
-            hourly_data = (
+            hourly_plan = (
                 data
-                .with_columns([
-                    # Floor to nearest hour to group both :00 and :30 readings
-                    pl.col(Columns.TIMESTAMP)
-                    .dt.truncate("1h")
-                    .alias(Columns.TIMESTAMP)
-                ])
-                .group_by(Columns.TIMESTAMP)
+                .lazy()
+                .sort(Columns.TIMESTAMP)
+                # Hourly windows group both :00 and :30 readings, output is sorted by window
+                .group_by_dynamic(Columns.TIMESTAMP, every="1h")
                 .agg([
-                    (pl.mean(Columns.POWER_KW)).alias(Columns.POWER_KW),
+                    pl.col(Columns.POWER_KW).mean().alias(Columns.POWER_KW),
                     # Sum energy readings from both intervals in the hour
-                    pl.sum(Columns.ENERGY_KWH).alias(Columns.ENERGY_KWH)
+                    pl.col(Columns.ENERGY_KWH).sum().alias(Columns.ENERGY_KWH)
                 ])
-                .sort(Columns.TIMESTAMP)
             )
 
+            # Group by + sum over a partition of the data can't lose energy,
+            # so only pay for the extra sums when debugging
+            if not LOGGER.isEnabledFor(logging.DEBUG):
+                return hourly_plan.collect(streaming=True)
+
+            energy_sums_plan = pl.concat(
+                [
+                    data.lazy().select(pl.col(Columns.ENERGY_KWH).sum().alias("original")),
+                    hourly_plan.select(pl.col(Columns.ENERGY_KWH).sum().alias("hourly")),
+                ],
+                how="horizontal"
+            )
+            hourly_data, energy_sums = pl.collect_all([hourly_plan, energy_sums_plan])
+
             # Validate the aggregation
-            _validate_hourly_aggregation(hourly_df=hourly_data, full_df=data)
+            _validate_hourly_aggregation(energy_sums)
 
             return hourly_data
 
@@ -1,12 +1,13 @@
 """Dominion Energy integration."""
+import shutil
 from pathlib import Path
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import Platform, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from webdriver_manager.chrome import ChromeDriverManager
 
-from custom_components.dominion_energy.const import DOMAIN, LOGGER
+from custom_components.dominion_energy.const import DOMAIN, LOGGER, CHROME_PROFILE_DIRECTORY
 from custom_components.dominion_energy.coordinator import DominionEnergyUpdateCoordinator
 from custom_components.dominion_energy.exceptions import SetupException
 
@@ -106,8 +107,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Remove the coordinator
-        hass.data[DOMAIN].pop(entry.entry_id)
+        # Remove the coordinator and close its browser session
+        coordinator: DominionEnergyUpdateCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     return True
 
@@ -116,12 +118,23 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await async_unload_entry(hass, entry)
     await async_setup_entry(hass, entry)
 
+def _remove_entry_files(download_dir: Path, username: str) -> None:
+    """Delete the entry's downloads and browser profile, run in the executor as it walks the disk."""
+    for file in download_dir.glob("*.xlsx"):
+        file.unlink()
+    profiles_dir = download_dir / CHROME_PROFILE_DIRECTORY
+    if profiles_dir.exists():
+        shutil.rmtree(profiles_dir / username, ignore_errors=True)
+        if not any(profiles_dir.iterdir()):
+            profiles_dir.rmdir()
+    download_dir.rmdir()
+
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle removal of an entry."""
     download_dir = Path(hass.config.path(data_config_path))
     try:
-        for file in download_dir.glob("*.xlsx"):
-            file.unlink()
-        download_dir.rmdir()
+        await hass.async_add_executor_job(
+            _remove_entry_files, download_dir, entry.data[CONF_USERNAME]
+        )
     except Exception as exception:
-        LOGGER.warning("Error cleaning up files: %s", str(exception))
\ No newline at end of file
+        LOGGER.warning("Error cleaning up files: %s", str(exception))
@@ -1,12 +1,16 @@
 import asyncio
-import json
+import functools
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Union, Optional, Dict
+from typing import Any, Callable, Union, Optional, Tuple, Final
 from zoneinfo import ZoneInfo
 
+import orjson
 from arrow import Arrow
-from functional import seq
 from selenium import webdriver
 from selenium.common import WebDriverException, TimeoutException
 from selenium.webdriver.chrome.options import Options
@@ -22,6 +26,25 @@ from custom_components.dominion_energy.exceptions import BrowserException, Canno
     DominionEnergyException
 from custom_components.dominion_energy.models import DominionCredentials, DownloadResult, BillSummary, LoginResult
 
+BILL_SUMMARY_PATTERNS = ["/GetBillandInvoiceHistory", "/current"]
+# Network events logged once a response body has been received, or will never be
+LOADING_DONE_EVENTS = frozenset({"Network.loadingFinished", "Network.loadingFailed"})
+CHROME_ARGUMENTS = (
+    "--headless",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--window-size=1280,800",
+)
+_ZERO: Final = Decimal("0")
+
+
+def _dec(value: Any) -> Decimal:
+    """Parse an amount from the bill API, treating a missing or blank value as zero."""
+    return Decimal(value) if value not in (None, "") else _ZERO
+
 
 class DominionScraper:
     def __init__(
@@ -29,31 +52,67 @@ class DominionScraper:
             credentials: DominionCredentials,
             driver_path: str,
             download_directory: Path = Path.cwd(),
+            profile_directory: Optional[Path] = None,
     ):
         self.credentials = credentials
         self.download_path = download_directory
+        self.profile_path = profile_directory
         self._driver: Optional[WebDriver] = None
         self._driver_path = driver_path
-        self._response_cache: Dict[str, dict] = {}
+        self._driver_executor: Optional[ThreadPoolExecutor] = None
+        self._portal_loaded = False  # Portal shell loaded by the latest login and not yet navigated
+        # Resolved once so every browser session downloads to the same directory
+        self._chrome_prefs = {
+            "download.default_directory": str(self.download_path.absolute()),
+            "download.prompt_for_download": False,
+            "download.directory_upgrade": True,
+            "safebrowsing.enabled": True
+        }
+        # A persistent profile keeps session cookies and the disk cache between browsers
+        self._chrome_arguments = CHROME_ARGUMENTS + (
+            (f"--user-data-dir={self.profile_path.absolute()}", "--profile-directory=Default")
+            if self.profile_path else ()
+        )
+
+    async def _run(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking call on the scraper's driver thread.
+        The ChromeDriver session is serial, so a single persistent worker matches it
+        and avoids dispatching every call to the default executor.
+        """
+        if self._driver_executor is None:
+            self._driver_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="dominion-driver"
+            )
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._driver_executor,
+            functools.partial(function, *args, **kwargs)
+        )
+
+    def _shutdown_driver_executor(self) -> None:
+        """Stop the driver thread, a new one is started by the next driver call."""
+        if self._driver_executor is not None:
+            self._driver_executor.shutdown(wait=False, cancel_futures=True)
+            self._driver_executor = None
 
     def _setup_chrome_options(self) -> Options:
         """Setup Chrome options with network logging enabled."""
+        # Options instances cannot be shared between drivers, only their contents are reused
         chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable_dev-shm")
+        for argument in self._chrome_arguments:
+            chrome_options.add_argument(argument)
 
-        # Enable network logging
+        # Enable network logging, Page events are never read so Chrome does not buffer them
         chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        chrome_options.add_experimental_option(
+            "perfLoggingPrefs",
+            {"enableNetwork": True, "enablePage": False}
+        )
 
         # Configure download behavior
-        prefs = {
-            "download.default_directory": str(self.download_path.absolute()),
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "safebrowsing.enabled": True
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
+        chrome_options.add_experimental_option("prefs", self._chrome_prefs)
         return chrome_options
 
     async def initialize_driver(self) -> None:
@@ -61,18 +120,21 @@ class DominionScraper:
         try:
             if self._driver:
                 # Clean up any existing driver
-                await asyncio.to_thread(self._driver.quit)
+                await self._cleanup_driver()
+
+            if self.profile_path:
+                await self._run(self._remove_profile_locks)
 
             service = Service(executable_path=self._driver_path)
 
-            self._driver = await asyncio.to_thread(
+            self._driver = await self._run(
                 webdriver.Chrome,
                 service=service,
                 options=self._setup_chrome_options(),
             )
 
             # Enable network tracking
-            await asyncio.to_thread(
+            await self._run(
                 self._driver.execute_cdp_cmd,
                 'Network.enable',
                 {}
@@ -84,42 +146,176 @@ class DominionScraper:
                 await self._cleanup_driver()
             raise BrowserException("Failed to initialize browser") from exception
 
+    def _remove_profile_locks(self) -> None:
+        """
+        Remove the profile's singleton lock files.
+        A browser that did not exit cleanly leaves them behind and Chrome then refuses the profile,
+        the previous driver has quit by now so no running browser still holds them.
+        """
+        for lock_file in self.profile_path.glob("Singleton*"):
+            try:
+                lock_file.unlink(missing_ok=True)
+            except OSError as exception:
+                LOGGER.warning("Failed to remove profile lock %s: %s", lock_file, str(exception))
+
     async def _cleanup_driver(self) -> None:
         """Safely cleanup the WebDriver."""
         if self._driver:
+            driver = self._driver
+            self._clear_driver()
+            # Drop queued driver calls, quit must not wait behind a call still in progress
+            self._shutdown_driver_executor()
             try:
                 # Use a timeout to ensure we don't block forever
                 async with asyncio.timeout(15):
                     # Create a separate thread for cleanup
-                    await asyncio.to_thread(self._cleanup_driver_sync)
+                    await asyncio.to_thread(self._cleanup_driver_sync, driver)
             except asyncio.TimeoutError:
                 LOGGER.warning("WebDriver cleanup timed out")
+                await asyncio.to_thread(self._kill_driver_service, driver)
             except Exception as exception:
                 LOGGER.error("Error cleaning up WebDriver: %s", str(exception))
-            finally:
-                await asyncio.to_thread(self._clear_driver)
+                await asyncio.to_thread(self._kill_driver_service, driver)
 
     def _clear_driver(self) -> None:
         """Clear the driver reference synchronously."""
         if self._driver:
             self._driver = None
 
-    def _cleanup_driver_sync(self) -> None:
+    @staticmethod
+    def _cleanup_driver_sync(driver: WebDriver) -> None:
         """Synchronous cleanup of WebDriver to be run in separate thread."""
         try:
-            if self._driver:
-                self._driver.quit()
+            driver.quit()
         except Exception as exception:
             LOGGER.error("Error in sync WebDriver cleanup: %s", str(exception))
-        finally:
-            # Clear the driver reference here in the sync context
-            self._driver = None
+            DominionScraper._kill_driver_service(driver)
+
+    @staticmethod
+    def _kill_driver_service(driver: WebDriver) -> None:
+        """Kill the ChromeDriver process so a failed quit does not orphan the browser."""
+        try:
+            process = driver.service.process
+            if process and process.poll() is None:
+                process.kill()
+                process.wait(5)
+        except Exception as exception:
+            LOGGER.error("Error killing ChromeDriver process: %s", str(exception))
+
+    @staticmethod
+    def _match_request_ids(
+            logs: list[dict],
+            needles: list[tuple[str, list[str]]],
+            request_ids: dict[str, str],
+            finished: set[str],
+    ) -> None:
+        """
+        Record the request ID of each JSON response in the logs whose URL matches a pattern,
+        and which of those requests have finished loading.
+
+        Args:
+            logs: Performance log entries
+            needles: (pattern, required URL substrings) pairs, built once per lookup
+            request_ids: Mapping of pattern to request ID, updated in place
+            finished: Request IDs whose body has been fully received, updated in place
+        """
+        remaining = [
+            (pattern, required)
+            for pattern, required in needles
+            if pattern not in request_ids
+        ]
+
+        for entry in logs:
+            try:
+                message = entry["message"]
+
+                # A matched response is only complete once its loading has finished,
+                # which is always logged after its responseReceived
+                if "Network.loading" in message and any(
+                        request_id in message
+                        for request_id in request_ids.values()
+                        if request_id not in finished
+                ):
+                    log = orjson.loads(message)["message"]
+                    if log["method"] in LOADING_DONE_EVENTS:
+                        finished.add(log["params"]["requestId"])
+                        continue
+
+                # Cheap substring checks on the raw entry so only responses
+                # for a still missing URL pattern are ever parsed
+                if not remaining or "Network.responseReceived" not in message or not any(
+                        pattern in message for pattern, _ in remaining
+                ):
+                    continue
+
+                log = orjson.loads(message)["message"]
+                # Only Network.* events are logged
+                if (
+                        log["method"] != "Network.responseReceived"
+                        or "response" not in log.get("params", {})
+                ):
+                    continue
+
+                response = log["params"]["response"]
+                url = response.get("url", "")
+
+                # Skip non-JSON responses
+                if response.get("mimeType") != "application/json":
+                    continue
+
+                # Check URL against the patterns still missing a response
+                for index, (pattern, required) in enumerate(remaining):
+                    if pattern not in url or not all(needle in url for needle in required):
+                        continue
+
+                    request_ids[pattern] = log["params"]["requestId"]
+                    del remaining[index]
+                    break  # Stop checking patterns once we find a match
+
+            except Exception as entry_exception:
+                LOGGER.warning(
+                    "Error processing log entry: %s",
+                    str(entry_exception)
+                )
+                continue
+
+    def _get_response_bodies(self, request_ids: dict[str, str]) -> dict[str, dict]:
+        """
+        Fetch and parse the body of each matched response in a single driver thread hop.
+        ChromeDriver runs CDP commands one at a time, so issuing them concurrently would only queue them.
+        """
+        responses: dict[str, dict] = {}
+        for pattern, request_id in request_ids.items():
+            try:
+                body_response = self._driver.execute_cdp_cmd(
+                    "Network.getResponseBody",
+                    {"requestId": request_id}
+                )
+                responses[pattern] = orjson.loads(body_response["body"])
+            except Exception as response_exception:
+                LOGGER.error(
+                    "Failed to get response body for %s: %s",
+                    pattern,
+                    str(response_exception)
+                )
+        return responses
+
+    def _poll_request_ids(
+            self,
+            needles: list[tuple[str, list[str]]],
+            request_ids: dict[str, str],
+            finished: set[str],
+    ) -> None:
+        """Drain the performance log and match its entries, run off the event loop."""
+        logs = self._driver.get_log("performance")
+        self._match_request_ids(logs, needles, request_ids, finished)
 
     async def _get_network_responses(
             self,
             patterns: list[str] | str,
             params: dict[str, dict[str, str]] | None = None,
-            wait_time: int = 5,
+            timeout: float = 15,
+            poll_interval: float = 0.2,
     ) -> dict[str, dict]:
         """
         Extract multiple response data from Chrome performance logs.
@@ -127,7 +323,8 @@ class DominionScraper:
         Args:
             patterns: List of URL patterns to match or single pattern string
             params: Optional dict of {pattern: {param_key: param_value}} for URL filtering
-            wait_time: Time to wait for responses in seconds
+            timeout: Maximum time to wait for all responses in seconds
+            poll_interval: Time between performance log polls in seconds
 
         Returns:
             Dictionary mapping pattern keys to response JSON data
@@ -137,99 +334,106 @@ class DominionScraper:
             url_patterns = [patterns] if isinstance(patterns, str) else patterns
             params = params or {}
 
-            # Wait for responses to be ready
-            await asyncio.sleep(wait_time)
-
-            responses: dict[str, dict] = {}
-            logs = await asyncio.to_thread(self._driver.get_log, "performance")
+            # URL substrings for each pattern's params, built once instead of per log entry
+            needles = [
+                (
+                    pattern,
+                    [f"{key}={value}" for key, value in params.get(pattern, {}).items()]
+                )
+                for pattern in url_patterns
+            ]
 
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
             request_ids: dict[str, str] = {}  # pattern -> request_id
+            finished: set[str] = set()  # request IDs that finished loading
+
+            # First pass - poll the log until every pattern has a response that finished loading,
+            # a body requested while it is still streaming comes back empty or truncated
+            while True:
+                await self._run(
+                    self._poll_request_ids,
+                    needles,
+                    request_ids,
+                    finished
+                )
 
-            # First pass - collect all matching request IDs
-            for entry in logs:
-                try:
-                    log = json.loads(entry["message"])["message"]
-                    if (
-                            "Network.responseReceived" not in log["method"]
-                            or "response" not in log.get("params", {})
-                    ):
-                        continue
-
-                    response = log["params"]["response"]
-                    url = response.get("url", "")
-
-                    # Skip non-JSON responses
-                    if response.get("mimeType") != "application/json":
-                        continue
+                complete = len(request_ids) == len(url_patterns) and finished.issuperset(request_ids.values())
+                if complete or loop.time() >= deadline:
+                    break
+                await asyncio.sleep(poll_interval)
 
-                    # Check URL against all patterns
-                    for pattern in url_patterns:
-                        if pattern not in url:
-                            continue
-
-                        # Check params if specified for this pattern
-                        pattern_params = params.get(pattern, {})
-                        if pattern_params and not all(
-                                f"{key}={value}" in url
-                                for key, value in pattern_params.items()
-                        ):
-                            continue
-
-                        request_ids[pattern] = log["params"]["requestId"]
-                        break  # Stop checking patterns once we find a match
-
-                except Exception as entry_exception:
-                    LOGGER.warning(
-                        "Error processing log entry: %s",
-                        str(entry_exception)
-                    )
-                    continue
+            if missing_patterns := set(url_patterns) - request_ids.keys():
+                LOGGER.warning(
+                    "Timed out waiting for responses: %s",
+                    ", ".join(sorted(missing_patterns))
+                )
+            if loading_patterns := {
+                pattern for pattern, request_id in request_ids.items() if request_id not in finished
+            }:
+                LOGGER.warning(
+                    "Timed out waiting for responses to finish loading: %s",
+                    ", ".join(sorted(loading_patterns))
+                )
 
             # Second pass - get response bodies
-            for pattern, request_id in request_ids.items():
-                try:
-                    body_response = await asyncio.to_thread(
-                        self._driver.execute_cdp_cmd,
-                        "Network.getResponseBody",
-                        {"requestId": request_id}
-                    )
-                    responses[pattern] = json.loads(body_response["body"])
-                except Exception as response_exception:
-                    LOGGER.error(
-                        "Failed to get response body for %s: %s",
-                        pattern,
-                        str(response_exception)
-                    )
-
-            return responses
+            return await self._run(self._get_response_bodies, request_ids)
 
         except Exception as exception:
             LOGGER.error("Failed to get network responses: %s", str(exception))
             return {}
 
-    async def _intercept_network_responses(self):
-        """Start intercepting network responses."""
-        if not self._driver:
+    def _has_valid_session_sync(self) -> bool:
+        """Check whether cookies from the persistent profile still authenticate the portal."""
+        self._driver.get("https://myaccount.dominionenergy.com/portal/")
+        try:
+            WebDriverWait(self._driver, 10).until(
+                EC.any_of(
+                    EC.url_contains("login.dominionenergy.com"),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "span[class*='currentBalance']")),
+                )
+            )
+        except TimeoutException:
+            return False
+        return "login.dominionenergy.com" not in self._driver.current_url
+
+    def _login_sync(self, reuse_session: bool) -> None:
+        """Fill in and submit the login form in a single hop on the driver thread.
+
+        Raises:
+        CannotConnect: Login page did not load
+        """
+        if reuse_session and self.profile_path and self._has_valid_session_sync():
+            LOGGER.debug("Reusing the saved browser session")
             return
 
-        script = """
-            const callback = async (requestId, request) => {
-                try {
-                    const response = await fetch(request.url);
-                    const data = await response.json();
-                    window.postMessage({
-                        type: 'network-response',
-                        url: request.url,
-                        response: data
-                    }, '*');
-                } catch (e) {
-                    console.error('Error intercepting response:', e);
-                }
-            };
-            """
-        await asyncio.to_thread(self._driver.execute_script, script)
-
-    async def login(self, close_browser_after: bool = False) -> LoginResult:
+        self._driver.get("https://login.dominionenergy.com/CommonLogin?SelectedAppName=Electric")
+
+        try:
+            email_field = WebDriverWait(self._driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "[id*='gigya-loginID-']")),
+            )
+        except TimeoutException as exception:
+            raise CannotConnect("Could not connect to login page") from exception
+
+        password_field = self._driver.find_element(By.CSS_SELECTOR, "[id*='gigya-password-']")
+
+        self._driver.execute_script("arguments[0].scrollIntoView(true);", email_field)
+
+        email_field.clear()
+        password_field.clear()
+
+        email_field.send_keys(self.credentials.email_address)
+        password_field.send_keys(self.credentials.password)
+
+        submit_buttons = self._driver.find_elements(
+            By.CSS_SELECTOR,
+            "input[type='submit'].gigya-input-submit",
+        )
+        submit_button: WebElement = submit_buttons[-1]
+        submit_button.click()
+
+    async def login(self, close_browser_after: bool = False, reuse_session: bool = True) -> LoginResult:
         """Attempt to log in to Dominion Energy website
 
         Raises:
@@ -243,59 +447,21 @@ class DominionScraper:
                 raise BrowserException(f"Failed to initialize browser: No Driver")
 
         try:
-            await asyncio.to_thread(
-                self._driver.get,
-                "https://login.dominionenergy.com/CommonLogin?SelectedAppName=Electric",
-            )
+            await self._run(self._login_sync, reuse_session)
+            self._portal_loaded = True
 
             try:
-                email_field = await asyncio.to_thread(
-                    WebDriverWait(self._driver, 10).until,
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "[id*='gigya-loginID-']")),
-                )
-            except TimeoutException as exception:
-                raise CannotConnect("Could not connect to login page") from exception
-
-            password_field = await asyncio.to_thread(
-                self._driver.find_element,
-                By.CSS_SELECTOR,
-                "[id*='gigya-password-']",
-            )
-
-            await asyncio.to_thread(
-                self._driver.execute_script,
-                "arguments[0].scrollIntoView(true);",
-                email_field,
-            )
-            await asyncio.sleep(1)
-
-            await asyncio.to_thread(email_field.clear)
-            await asyncio.to_thread(password_field.clear)
-
-            await asyncio.to_thread(email_field.send_keys, self.credentials.email_address)
-            await asyncio.to_thread(password_field.send_keys, self.credentials.password)
-
-            await asyncio.sleep(1)
-            submit_buttons = await asyncio.to_thread(
-                self._driver.find_elements,
-                By.CSS_SELECTOR,
-                "input[type='submit'].gigya-input-submit",
-            )
-            submit_button: WebElement = seq(submit_buttons).last()
-            await asyncio.to_thread(submit_button.click)
-
-            try:
-                # balance = await asyncio.to_thread(
+                # balance = await self._run(
                 #     WebDriverWait(self._driver, 10).until,
                 #     self._wait_for_balance,
                 # )
-                # balance_text = await asyncio.to_thread(lambda: balance.text)
+                # balance_text = await self._run(lambda: balance.text)
                 # LOGGER.debug(f"Current Balance: {balance_text}")  # TODO save balance as entity, also get date due
                 return LoginResult(success=True, balance=None)
             except TimeoutException as exception:
                 raise InvalidAuth(f"Invalid credentials for {self.credentials.email_address}") from exception
 
-        except InvalidAuth:
+        except (InvalidAuth, CannotConnect):
             raise
         except TimeoutException as exception:
             raise CannotConnect("Connection timed out") from exception
@@ -312,17 +478,17 @@ class DominionScraper:
         """Wait for and return the balance element if found."""
         try:
             # Get the element
-            element = await asyncio.to_thread(
+            element = await self._run(
                 driver.find_element,
                 By.CSS_SELECTOR,
                 "span[class*='currentBalance']"
             )
 
             # Get the text content
-            element_text = await asyncio.to_thread(lambda: element.text.strip())
+            element_text = await self._run(lambda: element.text.strip())
 
             # Check if it contains numbers
-            is_balance = seq(list(element_text)).exists(lambda char: char.isnumeric())
+            is_balance = any(char.isnumeric() for char in element_text)
 
             return element if is_balance else False
         except WebDriverException:
@@ -334,17 +500,29 @@ class DominionScraper:
             return False
 
         try:
-            await asyncio.sleep(10)
-            await asyncio.to_thread(
-                self._driver.get,
-                "https://myaccount.dominionenergy.com/portal/#/Usages",
+            # Wait for the login redirect to finish instead of a fixed delay
+            await self._run(
+                WebDriverWait(self._driver, 30).until,
+                EC.none_of(EC.url_contains("login.dominionenergy.com")),
             )
-
-            # Wait for navigation to complete and page to stabilize
-            await asyncio.sleep(10)
-
-            await asyncio.to_thread(
-                WebDriverWait(self._driver, 10).until,
+            current_url = await self._run(lambda: self._driver.current_url)
+            if "myaccount.dominionenergy.com/portal" not in current_url:
+                await self._run(
+                    self._driver.get,
+                    "https://myaccount.dominionenergy.com/portal/#/Usages",
+                )
+            else:
+                # Right after login the portal is already loaded, switching its route is enough
+                await self._run(self._driver.execute_script, "window.location.hash = '#/Usages';")
+                if not self._portal_loaded:
+                    # A route change keeps the old page, so a kept session reloads it
+                    # from the server for an expired login to be noticed
+                    await self._run(self._driver.refresh)
+            self._portal_loaded = False
+
+            # Wait only for the usage view to render
+            await self._run(
+                WebDriverWait(self._driver, 30).until,
                 EC.element_to_be_clickable(
                     (By.XPATH, "//a[contains(text(), 'Download 30-minute Data')]")
                 ),
@@ -354,40 +532,66 @@ class DominionScraper:
             LOGGER.error(f"Failed to navigate to usage: {str(exception)}")
             return False
 
-    async def _download_usage_data(self) -> Optional[Path]:
-        """Download usage data and return the path to downloaded file."""
+    async def _start_download(self) -> Optional[Tuple[float, set[str]]]:
+        """
+        Click the usage download link.
+
+        Returns:
+            Time the download was started and the names of files already in the download directory
+        """
         if not self._driver:
             return None
 
         try:
-            download_path = self.download_path
-            existing_files = set(download_path.glob("*.xlsx"))
-
-            download_button = await asyncio.to_thread(
+            download_button = await self._run(
                 WebDriverWait(self._driver, 10).until,
                 EC.element_to_be_clickable(
                     (By.XPATH, "//a[contains(text(), 'Download 30-minute Data')]")
                 ),
             )
             await asyncio.sleep(3)
-            await asyncio.to_thread(download_button.click)
+            existing_names = await asyncio.to_thread(os.listdir, self.download_path)
+            start_time = time.time()
+            await self._run(download_button.click)
+            return start_time, set(existing_names)
 
+        except Exception as exception:
+            LOGGER.error(f"Failed to download usage data: {str(exception)}")
+            return None
+
+    async def _wait_for_download(self, start_time: float, existing_names: set[str]) -> Optional[Path]:
+        """Wait for the usage download to finish and return the path to downloaded file."""
+        try:
+            download_path = self.download_path
             timestamp = Arrow.now().format("YYYYMMDD_HHmmss")
             expected_file = download_path / f"dominion_usage_{timestamp}.xlsx"
 
-            def find_new_excel_file():
-                new_files = seq(download_path.glob("*.xlsx")).to_set() - existing_files
-                if not new_files:
-                    return False
-                return seq(new_files).first()
+            def find_new_excel_file() -> Optional[Path]:
+                with os.scandir(download_path) as entries:
+                    files = {entry.name: entry for entry in entries if entry.is_file()}
+                for name, entry in files.items():
+                    # Earlier downloads are skipped by name before any stat call,
+                    # and Chrome keeps a .crdownload sibling until the download is finished
+                    if (
+                            name.endswith(".xlsx")
+                            and name not in existing_names
+                            and f"{name}.crdownload" not in files
+                            and entry.stat().st_mtime >= start_time
+                    ):
+                        return Path(entry.path)
+                return None
 
-            # Wait for download to complete with timeout
-            for _ in range(120):  # 2 minute timeout
+            # Wait for download to complete with timeout, polling quickly at first.
+            # Only the filesystem is touched, so this stays off the busy driver thread.
+            deadline = time.monotonic() + 120  # 2 minute timeout
+            delay = 0.25
+            while time.monotonic() < deadline:
                 new_file = await asyncio.to_thread(find_new_excel_file)
                 if new_file:
                     await asyncio.to_thread(new_file.rename, expected_file)
                     return expected_file
-                await asyncio.sleep(1)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 1.0)
 
             return None
 
@@ -395,29 +599,43 @@ class DominionScraper:
             LOGGER.error(f"Failed to download usage data: {str(exception)}")
             return None
 
+    def _open_bill_tab_sync(self) -> str:
+        """Open the bill page in a new tab and return the handle of the tab it replaced."""
+        previous_handle = self._driver.current_window_handle
+
+        # Discard log entries from earlier pages so only bill responses are matched
+        self._driver.get_log("performance")
+
+        self._driver.switch_to.new_window("tab")
+        self._driver.get("https://myaccount.dominionenergy.com/portal/#/ViewBill")
+        return previous_handle
+
+    def _close_bill_tab_sync(self, previous_handle: str) -> None:
+        """Close the bill tab and return to the tab the session was using."""
+        if self._driver.current_window_handle != previous_handle:
+            self._driver.close()
+        self._driver.switch_to.window(previous_handle)
+
     async def _fetch_bill_summary(self) -> Optional[BillSummary]:
         """Fetch bill summary information from both current and history endpoints."""
         if not self._driver:
             return None
 
         try:
-            await self._intercept_network_responses()
-
-            await asyncio.to_thread(
-                self._driver.get,
-                "https://myaccount.dominionenergy.com/portal/#/ViewBill",
-            )
-
-            await asyncio.sleep(3)
-
-            responses = await self._get_network_responses(
-                patterns=["/GetBillandInvoiceHistory", "/current"],
-                # Optional URL parameters if needed:
-                # params={
-                #     "/GetBillandInvoiceHistory": {"param1": "value1"},
-                #     "/current": {"param2": "value2"}
-                # }
-            )
+            # A separate tab leaves the usage page, and any download it started, untouched
+            previous_handle = await self._run(self._open_bill_tab_sync)
+            try:
+                # Resolves as soon as both bill responses have been received
+                responses = await self._get_network_responses(
+                    patterns=BILL_SUMMARY_PATTERNS,
+                    # Optional URL parameters if needed:
+                    # params={
+                    #     "/GetBillandInvoiceHistory": {"param1": "value1"},
+                    #     "/current": {"param2": "value2"}
+                    # }
+                )
+            finally:
+                await self._run(self._close_bill_tab_sync, previous_handle)
 
             if not responses:
                 LOGGER.error("No responses captured")
@@ -442,34 +660,81 @@ class DominionScraper:
 
             bill_summary = BillSummary(
                 account_number=current_data['accountNumber'],
-                previous_bill_period_start=Arrow.strptime(history_data['billPdStart'], "%m/%d/%Y %H:%M:%S"),
-                previous_bill_period_end=Arrow.strptime(history_data['billPdEnd'], "%m/%d/%Y %H:%M:%S"),
-                next_meter_read_date=Arrow.strptime(extension['NextMeterReadDate'], "%m-%d-%Y"),
-                previous_balance=Decimal(current_data['previousBalance']),
-                payments_received=Decimal(current_data['paymentReceived']),
-                remaining_balance=Decimal(current_data['remainingBalance']),
-                current_charges=Decimal(current_data['currentCharges']),
-                total_account_balance=Decimal(current_data['totalAmountDue']),
-                pending_payments=Decimal(extension['PendingPaymentAmount'])
-                if extension.get('PendingPaymentAmount') else Decimal('0'),
+                previous_bill_period_start=Arrow.fromdatetime(
+                    datetime.strptime(history_data['billPdStart'], "%m/%d/%Y %H:%M:%S")
+                ),
+                previous_bill_period_end=Arrow.fromdatetime(
+                    datetime.strptime(history_data['billPdEnd'], "%m/%d/%Y %H:%M:%S")
+                ),
+                next_meter_read_date=Arrow.fromdatetime(
+                    datetime.strptime(extension['NextMeterReadDate'], "%m-%d-%Y")
+                ),
+                previous_balance=_dec(current_data.get('previousBalance')),
+                payments_received=_dec(current_data.get('paymentReceived')),
+                remaining_balance=_dec(current_data.get('remainingBalance')),
+                current_charges=_dec(current_data.get('currentCharges')),
+                total_account_balance=_dec(current_data.get('totalAmountDue')),
+                pending_payments=_dec(extension.get('PendingPaymentAmount')),
                 is_meter_read_estimated=True  # We could potentially detect this from the data
             )
-            LOGGER.debug(f"Bill Summary: {bill_summary}")
+            LOGGER.debug("Bill Summary: %s", bill_summary)
             return bill_summary
 
         except Exception as exception:
             LOGGER.error(f"Failed to fetch bill summary: {str(exception)}")
             return None
 
+    async def _download_usage(self, tzinfo: ZoneInfo) -> DownloadResult:
+        """Download the usage data and bill summary with the current browser session."""
+        if not await self._navigate_to_usage():
+            return DownloadResult(
+                filepath=Path(),
+                timestamp=Arrow.now(),
+                success=False,
+                error="Navigation to usage failed"
+            )
+
+        download_started = await self._start_download()
+        if download_started is None:
+            return DownloadResult(
+                filepath=Path(),
+                timestamp=Arrow.now(),
+                success=False,
+                error="Download of usage data failed",
+            )
+
+        # Fetch the bill while Chrome finishes the download
+        downloaded_path, bill_summary = await asyncio.gather(
+            self._wait_for_download(*download_started),
+            self._fetch_bill_summary(),
+        )
+        if not downloaded_path:
+            return DownloadResult(
+                filepath=Path(),
+                timestamp=Arrow.now(),
+                success=False,
+                error="Download of usage data failed",
+            )
+
+        bill_summary.update_timezone(tzinfo)
+
+        return DownloadResult(
+            filepath=downloaded_path,
+            bill_summary=bill_summary,
+            timestamp=Arrow.now(),
+            success=True,
+        )
+
     async def fetch_usage_data(self, tzinfo: ZoneInfo) -> DownloadResult:
         """Main method to fetch usage data from Dominion Energy website"""
         self.download_path.mkdir(parents=True, exist_ok=True)
+        if self.profile_path:
+            self.profile_path.mkdir(parents=True, exist_ok=True)
 
         try:
-            await self.initialize_driver()
-
-            login_result = await self.login()
-            if not login_result.success:
+            # The browser session is kept between fetches and only started when missing
+            kept_session = self._driver is not None
+            if not kept_session and not (await self._start_session()).success:
                 return DownloadResult(
                     filepath=Path(),
                     timestamp=Arrow.now(),
@@ -477,43 +742,44 @@ class DominionScraper:
                     error="Login failed"
                 )
 
-            if not await self._navigate_to_usage():
-                return DownloadResult(
-                    filepath=Path(),
-                    timestamp=Arrow.now(),
-                    success=False,
-                    error="Navigation to usage failed"
-                )
-
-            downloaded_path = await self._download_usage_data()
-            if not downloaded_path:
-                return DownloadResult(
-                    filepath=Path(),
-                    timestamp=Arrow.now(),
-                    success=False,
-                    error="Download of usage data failed",
-                )
-
-            bill_summary = await self._fetch_bill_summary()
-            bill_summary.update_timezone(tzinfo)
+            result = await self._download_usage(tzinfo)
+            if not result.success and kept_session:
+                # Most likely the kept session expired, so log in again once
+                LOGGER.debug("%s, starting a new browser session", result.error)
+                if not (await self._start_session()).success:
+                    result = DownloadResult(
+                        filepath=Path(),
+                        timestamp=Arrow.now(),
+                        success=False,
+                        error="Login failed"
+                    )
+                else:
+                    result = await self._download_usage(tzinfo)
 
-            return DownloadResult(
-                filepath=downloaded_path,
-                bill_summary=bill_summary,
-                timestamp=Arrow.now(),
-                success=True,
-            )
+            if not result.success:
+                # Start over on the next fetch instead of reusing a browser that failed
+                await self.close()
+            return result
         except Exception as exception:
             LOGGER.error(f"Unexpected error: {str(exception)}")
+            # The browser is in an unknown state, start over on the next fetch
+            await self.close()
             return DownloadResult(
                 filepath=Path(),
                 timestamp=Arrow.now(),
                 success=False,
                 error=str(exception)
             )
-        finally:
-            if self._driver:
-                await self._cleanup_driver()
+
+    async def _start_session(self) -> LoginResult:
+        """Start a new browser, replacing any existing one, and log in."""
+        await self.initialize_driver()
+        return await self.login()
+
+    async def close(self) -> None:
+        """Close the browser session kept between fetches."""
+        if self._driver:
+            await self._cleanup_driver()
 
     async def __aenter__(self) -> "DominionScraper":
         """Async context manager entry."""
@@ -522,5 +788,4 @@ class DominionScraper:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit."""
-        if self._driver:
-            await self._cleanup_driver()
\ No newline at end of file
+        await self.close()
\ No newline at end of file
@@ -41,10 +41,24 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 
 async def validate_auth(
         hass: HomeAssistant,
-        credentials: DominionCredentials
+        credentials: DominionCredentials,
+        entry_id: str | None = None,
 ) -> None:
     """Test if credentials are valid."""
     try:
+        # Reauth of a loaded entry logs in with the browser its coordinator already has
+        if coordinator := hass.data.get(DOMAIN, {}).get(entry_id):
+            async with coordinator.scraper_lock:
+                previous_credentials = coordinator.scraper.credentials
+                coordinator.scraper.credentials = credentials
+                try:
+                    await coordinator.scraper.login(close_browser_after=False, reuse_session=False)
+                except Exception:
+                    # Updates keep using the stored credentials until the reauth succeeds
+                    coordinator.scraper.credentials = previous_credentials
+                    raise
+            return
+
         driver_path = await _async_get_or_install_chrome_driver(hass)
 
         async with DominionScraper(
@@ -144,12 +158,12 @@ class DominionEnergyConfigFlow(ConfigFlow, domain=DOMAIN):
             }
 
             credentials = DominionCredentials(
-                email_address=self.entry.data[CONF_USERNAME],
+                email_address=self.reauth_entry.data[CONF_USERNAME],
                 password=user_input[CONF_PASSWORD],
             )
 
             try:
-                await validate_auth(self.hass, credentials)
+                await validate_auth(self.hass, credentials, self.reauth_entry.entry_id)
             except SetupException:
                 errors["base"] = "browser_setup"
             except InvalidAuth:
@@ -5,3 +5,6 @@ from logging import Logger, getLogger
 LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "dominion_energy"
+
+# Subdirectory of the download directory holding a Chrome profile per account
+CHROME_PROFILE_DIRECTORY = "chrome_profiles"
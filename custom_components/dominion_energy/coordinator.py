@@ -1,14 +1,13 @@
+import asyncio
+import functools
 from collections.abc import Mapping
 from datetime import timedelta, datetime
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from arrow import Arrow
-from functional import seq
 from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
-from homeassistant.components.recorder.statistics import get_last_statistics, statistics_during_period, \
-    async_add_external_statistics
+from homeassistant.components.recorder.statistics import get_last_statistics, async_add_external_statistics
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, UnitOfEnergy
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
@@ -18,10 +17,29 @@ import polars as pl
 
 from custom_components.dominion_energy.DominionDataProcessor import DominionDataProcessor
 from custom_components.dominion_energy.api.DominionScraper import DominionScraper
-from custom_components.dominion_energy.const import LOGGER, DOMAIN
+from custom_components.dominion_energy.const import LOGGER, DOMAIN, CHROME_PROFILE_DIRECTORY
 from custom_components.dominion_energy.exceptions import InvalidAuth
 from custom_components.dominion_energy.models import DominionCredentials, BillSummary
-from custom_components.dominion_energy.models.attributes import Columns
+from custom_components.dominion_energy.models.attributes import Columns, UsageStats
+
+STATISTICS_BATCH_SIZE = 500
+
+# Column expressions used by the statistics query, built once
+TIMESTAMP_COLUMN = pl.col(Columns.TIMESTAMP)
+ENERGY_KWH_COLUMN = pl.col(Columns.ENERGY_KWH)
+
+
+def _unix_to_local(timestamp_unix: float, tzinfo: ZoneInfo) -> datetime:
+    """Convert a unix timestamp to a datetime in the given time zone."""
+    return datetime.fromtimestamp(timestamp_unix, tz=tzinfo)
+
+
+def _thirty_days_ago(tzinfo: ZoneInfo) -> datetime:
+    """Get local midnight 30 days ago in the given time zone."""
+    return (
+        (datetime.now(tzinfo) - timedelta(days=30))
+        .replace(hour=0, minute=0, second=0, microsecond=0)
+    )
 
 
 class DominionEnergyUpdateCoordinator(DataUpdateCoordinator[pl.DataFrame]):
@@ -50,9 +68,29 @@ class DominionEnergyUpdateCoordinator(DataUpdateCoordinator[pl.DataFrame]):
             credentials=self._credentials,
             download_directory=download_dir,
             driver_path=driver_path,
+            profile_directory=download_dir / CHROME_PROFILE_DIRECTORY / self._credentials.email_address,
         )
+        # Serializes the shared browser between updates and reauth logins
+        self._scraper_lock = asyncio.Lock()
         self.bill_summary: BillSummary | None = None
+        self.usage_stats: UsageStats | None = None
         self._last_data: pl.DataFrame | None = None
+        self._last_digest: str | None = None
+
+    @property
+    def scraper(self) -> DominionScraper:
+        """Scraper holding the browser session used for updates."""
+        return self._scraper
+
+    @property
+    def scraper_lock(self) -> asyncio.Lock:
+        """Lock held while the scraper's browser is in use."""
+        return self._scraper_lock
+
+    async def async_shutdown(self) -> None:
+        """Close the browser kept open between updates."""
+        await super().async_shutdown()
+        await self._scraper.close()
 
     async def _async_update_data(self) -> pl.DataFrame:
         """Fetch data from Dominion Energy"""
@@ -62,7 +100,8 @@ class DominionEnergyUpdateCoordinator(DataUpdateCoordinator[pl.DataFrame]):
             timezone = str(self.hass.config.time_zone)
             tzinfo = ZoneInfo(timezone)
 
-            download_result = await self._scraper.fetch_usage_data(tzinfo)
+            async with self._scraper_lock:
+                download_result = await self._scraper.fetch_usage_data(tzinfo)
 
             if not download_result.success:
                 raise RuntimeError(f"Failed to fetch data: {download_result.error}")
@@ -72,13 +111,24 @@ class DominionEnergyUpdateCoordinator(DataUpdateCoordinator[pl.DataFrame]):
                 file_path=download_result.filepath,
                 timezone=timezone
             )
-            data = await processor.process_for_entities()
-
             self.bill_summary = download_result.bill_summary
-            account_id = download_result.bill_summary.account_number
 
-            await self._insert_statistics(data, account_id, processor, timezone)
-            self._last_data = data
+            # Dominion has not published new readings, the previous result still holds
+            digest = await processor.source_digest()
+            if self._last_data is not None and digest == self._last_digest:
+                LOGGER.debug("Usage data unchanged since the last update")
+                data = self._last_data
+            else:
+                data = await processor.process_for_entities()
+
+                account_id = download_result.bill_summary.account_number
+
+                await self._insert_statistics(data, account_id, processor, tzinfo)
+                self._last_data = data
+                self._last_digest = digest
+
+            # The bill can move on without new readings, so the sensor stats are always refreshed
+            self.usage_stats = UsageStats.from_dataframe(data, self.bill_summary)
             return data
 
         except InvalidAuth as exception:
@@ -87,9 +137,12 @@ class DominionEnergyUpdateCoordinator(DataUpdateCoordinator[pl.DataFrame]):
             LOGGER.error("Error fetching Dominion Energy data: %s", str(exception))
             raise
         finally:
-            if downloaded_file and downloaded_file.exists():
+            if downloaded_file:
                 try:
-                    downloaded_file.unlink()
+                    # Filesystem calls block, so keep them off the event loop
+                    await self.hass.async_add_executor_job(
+                        functools.partial(downloaded_file.unlink, missing_ok=True)
+                    )
                     LOGGER.debug("Cleaned up downloaded file: %s", downloaded_file)
                 except Exception as exception:
                     LOGGER.warning(
@@ -103,18 +156,18 @@ class DominionEnergyUpdateCoordinator(DataUpdateCoordinator[pl.DataFrame]):
             data: pl.DataFrame,
             account_id: str,
             processor: DominionDataProcessor,
-            timezone: str
+            tzinfo: ZoneInfo
     ):
         """Insert energy usage statistics into Home Assistant."""
 
         statistic_id = f"{DOMAIN}:{account_id}_energy_consumption"
-        LOGGER.warning(f"Time zone: {timezone}")
+        LOGGER.debug("Time zone: %s", tzinfo)
 
         hourly_df = processor.process_for_statistics(data)
 
         # Get last statistics for this statistic ID
         last_stat = await get_instance(self.hass).async_add_executor_job(
-            get_last_statistics, self.hass, 1, statistic_id, True, set()
+            get_last_statistics, self.hass, 1, statistic_id, True, {"sum"}
         )
 
         if last_stat and statistic_id in last_stat and last_stat[statistic_id]:
@@ -138,101 +191,60 @@ class DominionEnergyUpdateCoordinator(DataUpdateCoordinator[pl.DataFrame]):
             last_stat_time = None
             last_stat_sum = 0.0
 
-        async def get_and_convert_timestamp(timestamp_unix: float) -> datetime:
-            """Convert unix timestamp to datetime with timezone in executor."""
-            def _convert():
-                naive_dt = Arrow.fromtimestamp(timestamp_unix, timezone).naive
-                return naive_dt.replace(tzinfo=ZoneInfo(timezone))
-
-            return await self.hass.async_add_executor_job(_convert)
-
-        async def get_thirty_days_ago() -> datetime:
-            """Get timestamp from 30 days ago in executor."""
-            def _convert():
-                # Get naive datetime from Arrow
-                dt = (
-                    Arrow.now()
-                    .floor('day')
-                    .shift(days=-30)
-                    .naive
-                )
-                # Attach timezone explicitly
-                return dt.replace(tzinfo=ZoneInfo(timezone))
-
-            return await self.hass.async_add_executor_job(_convert)
-
         # Get the timestamp we should start from
-        start_time_unix: float | None = None if not last_stat else last_stat[statistic_id][0]["start"]
+        start_time_unix: float | None = last_stat_time
 
         if start_time_unix is None:
             # First time processing - use all data
-            usage_data = hourly_df
+            usage_data = hourly_df.lazy()
             base_sum = 0.0
             LOGGER.debug("Processing all available data for first time")
 
         else:
-            start_time = await get_and_convert_timestamp(start_time_unix)
-            thirty_days_ago = await get_thirty_days_ago()
-            correction_start = max(start_time, thirty_days_ago)
-
-            LOGGER.debug(f"Start time: {start_time}")
-            LOGGER.debug(f"Start time zone: {start_time.tzinfo}")
-            LOGGER.debug(f"Correction start: {correction_start}")
-            LOGGER.debug(f"Correction start time zone: {correction_start.tzinfo}")
-
-            # Get the last sum before our correction window to use as base
-            stats_before_correction = await get_instance(self.hass).async_add_executor_job(
-                statistics_during_period,
-                self.hass,
-                correction_start,  # From beginning
-                None,
-                {statistic_id},
-                "hour",
-                None,
-                {"sum"},
-            )
-
-            base_sum = (
-                stats_before_correction[statistic_id][-1]["sum"]  # Get the last known sum value
-                if stats_before_correction and statistic_id in stats_before_correction  # Check if we have prior stats
-                else 0.0  # If no prior stats, start from zero
-            )
-
-            LOGGER.debug(
-                "Stats in correction window: \nFirst: %s\nLast: %s",
-                stats_before_correction[statistic_id][0],
-                stats_before_correction[statistic_id][-1]
+            start_time = _unix_to_local(start_time_unix, tzinfo)
+            correction_start = max(start_time, _thirty_days_ago(tzinfo))
+
+            LOGGER.debug("Start time: %s", start_time)
+            LOGGER.debug("Start time zone: %s", start_time.tzinfo)
+            LOGGER.debug("Correction start: %s", correction_start)
+            LOGGER.debug("Correction start time zone: %s", correction_start.tzinfo)
+
+            # The last statistic already carries the latest known sum, so no window query is needed
+            base_sum = last_stat_sum
+
+            # Only include data after the correction start time,
+            # hourly rows come out of group_by_dynamic in timestamp order
+            usage_data = (
+                hourly_df
+                .lazy()
+                .set_sorted(Columns.TIMESTAMP)
+                .filter(TIMESTAMP_COLUMN > correction_start)
             )
+            LOGGER.debug("Processing data after %s with base sum %s", correction_start, base_sum)
 
-            # Only include data after the correction start time
-            usage_data = hourly_df.filter(pl.col(Columns.TIMESTAMP) > pl.lit(correction_start))
-            LOGGER.debug(f"Processing data after {correction_start} with base sum {base_sum}")
-
-        if usage_data.height == 0:
-            LOGGER.debug("No new data to add to statistics")
-            return
-
+        # Filter, running sum and projection run as one optimized query
         energy_sum = (
             usage_data
             .with_columns(
-                (pl.col(Columns.ENERGY_KWH).cum_sum() + base_sum).alias("cum_sum")
+                (ENERGY_KWH_COLUMN.cum_sum() + base_sum).alias("cum_sum")
             )
+            .select([Columns.TIMESTAMP, Columns.ENERGY_KWH, "cum_sum"])
+            .collect(streaming=True)
         )
 
-        def _create_statistic_data(row: dict[str, Any]) -> StatisticData:
-            """Create a StatisticData object from a row of energy data."""
-            return StatisticData(
-                start=row["timestamp"],
-                state=row["energy_kwh"],
-                sum=row["cum_sum"],
-            )
+        if energy_sum.height == 0:
+            LOGGER.debug("No new data to add to statistics")
+            return
 
-        # Convert DataFrame rows to statistics
-        stats: list[StatisticData] = (
-            seq(energy_sum.iter_rows(named=True))
-            .map(_create_statistic_data)
-            .to_list()
-        )
+        # Convert DataFrame columns to statistics
+        stats: list[StatisticData] = [
+            StatisticData(start=start, state=state, sum=cum_sum)
+            for start, state, cum_sum in zip(
+                energy_sum.get_column(Columns.TIMESTAMP).to_list(),
+                energy_sum.get_column(Columns.ENERGY_KWH).to_list(),
+                energy_sum.get_column("cum_sum").to_list(),
+            )
+        ]
 
         metadata = StatisticMetaData(
             name=f"Dominion Energy {account_id} Energy Consumption",
@@ -243,5 +255,11 @@ class DominionEnergyUpdateCoordinator(DataUpdateCoordinator[pl.DataFrame]):
             unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR
         )
 
-        LOGGER.debug(f"Adding {len(stats)} statistics")
-        async_add_external_statistics(self.hass, metadata, stats)
+        LOGGER.debug("Adding %d statistics", len(stats))
+        # Smaller batches let the recorder start writing before a long backfill is fully queued
+        for index in range(0, len(stats), STATISTICS_BATCH_SIZE):
+            async_add_external_statistics(
+                self.hass,
+                metadata,
+                stats[index:index + STATISTICS_BATCH_SIZE]
+            )
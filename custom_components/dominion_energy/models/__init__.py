@@ -1,3 +1,4 @@
+import functools
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
@@ -6,16 +7,16 @@ from zoneinfo import ZoneInfo
 
 import arrow
 from arrow import Arrow
-from attr import dataclass
+from attrs import define
 
 
-@dataclass
+@define(frozen=True)
 class DominionCredentials:
     email_address: str
     password: str
 
 
-@dataclass
+@define
 class BillSummary:
     """Represents a Dominion Energy bill summary."""
     account_number: str
@@ -34,7 +35,7 @@ class BillSummary:
     def update_timezone(self, new_timezone: ZoneInfo | None) -> None:
         self.timezone = new_timezone
 
-@dataclass
+@define(frozen=True)
 class DownloadResult:
     filepath: Path = Path()
     timestamp: arrow.Arrow = arrow.now(tz="local")
@@ -42,14 +43,14 @@ class DownloadResult:
     bill_summary: Optional[BillSummary] = None
     error: str | None = None
 
-@dataclass
+@define(frozen=True)
 class LoginResult:
     """Result of a login attempt."""
     success: bool
     error: str | None = None
     balance: str | None = None # TODO probably not needed when saving
 
-@dataclass(frozen=True)
+@define(frozen=True)
 class YearToDateMetrics:
     """Year to date usage metrics."""
     current_year: int
@@ -61,27 +62,21 @@ class YearToDateMetrics:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for state attributes."""
-        base_dict = {
+        return {
             "current_year": self.current_year,
             "total_usage_kwh": self.total_usage_kwh,
             "total_cost": self.total_cost,
             "days_elapsed": self.days_elapsed,
             "daily_average_kwh": self.daily_average_kwh,
-        }
-
-        if self.comparison_years:
-            base_dict.update({
-                f"year_{year}_usage": data["usage"]
-                for year, data in self.comparison_years.items()
-            })
-            base_dict.update({
-                f"year_{year}_daily_average": data["daily_avg"]
+            # Both per-year attributes are built in a single pass over the comparison years
+            **{
+                f"year_{year}_{name}": data[key]
                 for year, data in self.comparison_years.items()
-            })
-
-        return base_dict
+                for name, key in (("usage", "usage"), ("daily_average", "daily_avg"))
+            },
+        }
 
-@dataclass(frozen=True)
+@define(frozen=True)
 class EnergyUsagePeriodComparison:
     """Comparison of energy usage between two billing periods."""
     current_kwh: float
@@ -117,6 +112,11 @@ class EnergyUsagePeriodComparison:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for state attributes."""
+        return self._attributes
+
+    @functools.cached_property
+    def _attributes(self) -> dict[str, Any]:
+        """State attributes, computed once as the comparison is frozen."""
         return {
             "current_kwh": self.current_kwh,
             "previous_kwh": self.previous_kwh,
@@ -128,7 +128,7 @@ class EnergyUsagePeriodComparison:
             "previous_daily_average_kwh": self.previous_kwh / max(self.days_previous, 1),
         }
 
-@dataclass(frozen=True)
+@define(frozen=True)
 class BillingPeriodComparison:
     """Comparison of costs between two billing periods."""
     current_dollars: float
@@ -164,6 +164,11 @@ class BillingPeriodComparison:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for state attributes."""
+        return self._attributes
+
+    @functools.cached_property
+    def _attributes(self) -> dict[str, Any]:
+        """State attributes, computed once as the comparison is frozen."""
         return {
             "current_dollars": self.current_dollars,
             "previous_dollars": self.previous_dollars,
@@ -1,12 +1,13 @@
 """Data classes for sensor attributes."""
-from dataclasses import asdict, dataclass
-from datetime import date, datetime
-from typing import Any
+import functools
+from datetime import date, datetime, timedelta
+from typing import Any, Callable
 
 import polars as pl
-from arrow import Arrow
-from polars import DataFrame
+from attrs import define
+from polars import DataFrame, LazyFrame
 
+from custom_components.dominion_energy.const import LOGGER
 from custom_components.dominion_energy.models import BillSummary
 
 
@@ -16,6 +17,8 @@ class Columns:
     TIMESTAMP = "timestamp"
     POWER_KW = "power_kw"
     ENERGY_KWH = "energy_kwh"
+    # Local calendar day of the timestamp
+    DATE = "date"
 
     # Derived column names (from aggregations)
     TOTAL_ENERGY_KWH = "total_energy_kwh"
@@ -23,13 +26,13 @@ class Columns:
     AVG_POWER_KW = "avg_power_kw"
     PEAK_POWER_KW = "peak_power_kw"
 
-@dataclass
+@define(frozen=True)
 class PeakPower:
     """Peak power information."""
     value: float
     timestamp: datetime
 
-@dataclass
+@define(frozen=True)
 class DailyUsage:
     """Daily energy usage information."""
     date: date
@@ -37,8 +40,51 @@ class DailyUsage:
     avg_power_kw: float
     peak_power_kw: float
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for HA state attributes."""
+        return {
+            "date": self.date,
+            "total_energy_kwh": self.total_energy_kwh,
+            "avg_power_kw": self.avg_power_kw,
+            "peak_power_kw": self.peak_power_kw,
+        }
+
 
-@dataclass
+def _daily_usages(daily_data: DataFrame) -> list[DailyUsage]:
+    """Build DailyUsage objects from per day aggregates, one column at a time."""
+    # Columns are passed positionally in DailyUsage field order
+    return list(map(
+        DailyUsage,
+        daily_data.get_column(Columns.DATE).to_list(),
+        daily_data.get_column(Columns.TOTAL_ENERGY_KWH).to_list(),
+        daily_data.get_column(Columns.AVG_POWER_KW).to_list(),
+        daily_data.get_column(Columns.PEAK_POWER_KW).to_list(),
+    ))
+
+
+def _daily_aggregates_plan(data: DataFrame, first_date: date) -> LazyFrame:
+    """Per day aggregates of the readings from first_date on, sorted by date."""
+    return (
+        data
+        .lazy()
+        # Only the grouped and aggregated columns go through the group by
+        .select([Columns.DATE, Columns.TIMESTAMP, Columns.ENERGY_KWH, Columns.POWER_KW])
+        .filter(pl.col(Columns.DATE) >= first_date)
+        .group_by(Columns.DATE)
+        .agg([
+            pl.sum(Columns.ENERGY_KWH).alias(Columns.TOTAL_ENERGY_KWH),
+            pl.mean(Columns.POWER_KW).alias(Columns.AVG_POWER_KW),
+            pl.max(Columns.POWER_KW).alias(Columns.PEAK_POWER_KW),
+            # Time of the day's first peak reading, used by DailyStats
+            pl.col(Columns.TIMESTAMP).get(pl.col(Columns.POWER_KW).arg_max()),
+            pl.len().alias("data_points"),
+        ])
+        # Groups come back in no particular order
+        .sort(Columns.DATE)
+    )
+
+
+@define(frozen=True)
 class DailyStats:
     """Daily power and energy statistics."""
     usage: DailyUsage
@@ -49,39 +95,46 @@ class DailyStats:
     def day(self) -> date:
         return self.usage.date
 
+    @staticmethod
+    def _plan(data: DataFrame) -> LazyFrame:
+        """Aggregates over the latest day's readings."""
+        # Readings are sorted by timestamp, the last one is from the latest day
+        return _daily_aggregates_plan(data, data.get_column(Columns.DATE).last())
+
     @classmethod
-    def from_dataframe(cls, data: DataFrame) -> "DailyStats":
-        """Create DailyStats from a DataFrame."""
-        latest_date = data.get_column(Columns.TIMESTAMP).dt.date().max()
-        daily_data = data.filter(pl.col(Columns.TIMESTAMP).dt.date() == latest_date)
-
-        peak_value = daily_data.get_column(Columns.POWER_KW).max()
-        peak_time = (
-            daily_data
-            .filter(pl.col(Columns.POWER_KW) == peak_value)
-            .get_column(Columns.TIMESTAMP)
-            .first()
-        )
+    def _from_aggregates(cls, daily_data: DataFrame) -> "DailyStats":
+        """Create DailyStats from the last row of per day aggregates."""
+        row = daily_data.row(-1, named=True)
 
         usage = DailyUsage(
-            date=latest_date,
-            total_energy_kwh=daily_data.get_column(Columns.ENERGY_KWH).sum(),
-            avg_power_kw=daily_data.get_column(Columns.POWER_KW).mean(),
-            peak_power_kw=peak_value
+            date=row[Columns.DATE],
+            total_energy_kwh=row[Columns.TOTAL_ENERGY_KWH],
+            avg_power_kw=row[Columns.AVG_POWER_KW],
+            peak_power_kw=row[Columns.PEAK_POWER_KW]
         )
 
         return cls(
             usage=usage,
             peak_power=PeakPower(
-                value=peak_value,
-                timestamp=peak_time,
+                value=row[Columns.PEAK_POWER_KW],
+                timestamp=row[Columns.TIMESTAMP],
             ),
-            average_power_kw=daily_data.get_column(Columns.POWER_KW).mean(),
-            data_points=daily_data.height,
+            average_power_kw=row[Columns.AVG_POWER_KW],
+            data_points=row["data_points"],
         )
 
+    @classmethod
+    def from_dataframe(cls, data: DataFrame) -> "DailyStats":
+        """Create DailyStats from a DataFrame."""
+        return cls._from_aggregates(cls._plan(data).collect(streaming=True))
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for HA state attributes."""
+        return self._attributes
+
+    @functools.cached_property
+    def _attributes(self) -> dict[str, Any]:
+        """State attributes, computed once as the stats are frozen."""
         # Create a flattened version for clearer attribute display
         flat_dict = {
             "date": self.day(),
@@ -93,7 +146,7 @@ class DailyStats:
         }
         return flat_dict
 
-@dataclass
+@define(frozen=True)
 class WeeklyAnalysis:
     """Weekly usage analysis."""
     total_energy_kwh: float
@@ -102,60 +155,27 @@ class WeeklyAnalysis:
     highest_usage: DailyUsage
     lowest_usage: DailyUsage
 
-    @classmethod
-    def from_dataframe(cls, data: DataFrame) -> "WeeklyAnalysis":
-        """Create WeeklyAnalysis from a DataFrame."""
+    @staticmethod
+    def _plan(data: DataFrame) -> LazyFrame:
+        """Per day aggregates for the latest week of readings."""
+        # Readings are sorted by timestamp, only group the latest week of them
+        week_start = data.get_column(Columns.DATE).last() - timedelta(days=6)
+        return _daily_aggregates_plan(data, week_start)
 
-        daily_data = (
-            data
-            .group_by(pl.col(Columns.TIMESTAMP).dt.date())
-            .agg([
-                pl.sum(Columns.ENERGY_KWH).alias(Columns.TOTAL_ENERGY_KWH),
-                pl.mean(Columns.POWER_KW).alias(Columns.AVG_POWER_KW),
-                pl.max(Columns.POWER_KW).alias(Columns.PEAK_POWER_KW),
-            ])
-            .tail(7)
-            .sort(Columns.TIMESTAMP)
-        )
-        weekly_total = daily_data.get_column(Columns.TOTAL_ENERGY_KWH).sum()
-        avg_daily_energy_kwh = daily_data.get_column(Columns.TOTAL_ENERGY_KWH).mean()
-
-        daily_usages = [
-            DailyUsage(**row)
-            for row in daily_data
-            .select([
-                pl.col(Columns.TIMESTAMP).alias("date"),
-                pl.col(Columns.TOTAL_ENERGY_KWH),
-                pl.col(Columns.AVG_POWER_KW),
-                pl.col(Columns.PEAK_POWER_KW),
-            ])
-            .iter_rows(named=True)
-        ]
-
-        highest_row = DailyUsage(
-            **daily_data
-            .filter(pl.col(Columns.TOTAL_ENERGY_KWH) == pl.col(Columns.TOTAL_ENERGY_KWH).max())
-            .select([
-                pl.col(Columns.TIMESTAMP).alias("date"),
-                pl.col(Columns.TOTAL_ENERGY_KWH),
-                pl.col(Columns.AVG_POWER_KW),
-                pl.col(Columns.PEAK_POWER_KW),
-            ])
-            .row(0, named=True)
-        )
+    @classmethod
+    def _from_daily_data(cls, daily_data: DataFrame) -> "WeeklyAnalysis":
+        weekly_total, avg_daily_energy_kwh, highest_index, lowest_index = daily_data.select(
+            pl.col(Columns.TOTAL_ENERGY_KWH).sum(),
+            pl.col(Columns.TOTAL_ENERGY_KWH).mean().alias(Columns.AVG_DAILY_ENERGY_KWH),
+            pl.col(Columns.TOTAL_ENERGY_KWH).arg_max().alias("highest_index"),
+            pl.col(Columns.TOTAL_ENERGY_KWH).arg_min().alias("lowest_index"),
+        ).row(0)
 
+        daily_usages = _daily_usages(daily_data)
 
-        lowest_row = DailyUsage(
-            **daily_data
-            .filter(pl.col(Columns.TOTAL_ENERGY_KWH) == pl.col(Columns.TOTAL_ENERGY_KWH).min())
-            .select([
-                pl.col(Columns.TIMESTAMP).alias("date"),
-                pl.col(Columns.TOTAL_ENERGY_KWH),
-                pl.col(Columns.AVG_POWER_KW),
-                pl.col(Columns.PEAK_POWER_KW),
-            ])
-            .row(0, named=True)
-        )
+        # The first day with the highest and lowest totals, in date order
+        highest_row = daily_usages[highest_index]
+        lowest_row = daily_usages[lowest_index]
 
         return cls(
             total_energy_kwh=weekly_total,
@@ -165,11 +185,27 @@ class WeeklyAnalysis:
             lowest_usage=lowest_row
         )
 
+    @classmethod
+    def from_dataframe(cls, data: DataFrame) -> "WeeklyAnalysis":
+        """Create WeeklyAnalysis from a DataFrame."""
+        return cls._from_daily_data(cls._plan(data).collect(streaming=True))
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for HA state attributes."""
-        return asdict(self)
+        return self._attributes
 
-@dataclass
+    @functools.cached_property
+    def _attributes(self) -> dict[str, Any]:
+        """State attributes, computed once as the stats are frozen."""
+        return {
+            "total_energy_kwh": self.total_energy_kwh,
+            "avg_daily_energy_kwh": self.avg_daily_energy_kwh,
+            "daily_totals": [day.to_dict() for day in self.daily_totals],
+            "highest_usage": self.highest_usage.to_dict(),
+            "lowest_usage": self.lowest_usage.to_dict(),
+        }
+
+@define(frozen=True)
 class BillingPeriodStats:
     start_date: date
     days_in_period: int
@@ -180,13 +216,9 @@ class BillingPeriodStats:
     peak_power: PeakPower
 
     @classmethod
-    def from_dataframe(
-            cls,
-            data: DataFrame,
-            bill: BillSummary,
-    ) -> "BillingPeriodStats":
-        now = Arrow.now().naive.replace(tzinfo=bill.timezone)
-        data_unavailable_stat = cls(
+    def _unavailable(cls, bill: BillSummary) -> "BillingPeriodStats":
+        now = datetime.now(tz=bill.timezone)
+        return cls(
             start_date=now,
             total_energy_kwh=0.0,
             daily_average_kwh=0.0,
@@ -204,69 +236,68 @@ class BillingPeriodStats:
             )
         )
 
-        if not bill.previous_bill_period_end:
-            return data_unavailable_stat
-
+    @staticmethod
+    def _period(bill: BillSummary) -> tuple[datetime, datetime]:
         period_start = bill.previous_bill_period_end.shift(days=1).naive.replace(tzinfo=bill.timezone)
         period_end = bill.next_meter_read_date.naive.replace(tzinfo=bill.timezone)
-
-        period_data = (
-            data
-            .filter(
-                (pl.col(Columns.TIMESTAMP).dt.date() >= period_start.date()) &
-                (pl.col(Columns.TIMESTAMP).dt.date() <= period_end.date())
-            )
-        )
-
-        daily_data = (
+        return period_start, period_end
+
+    @staticmethod
+    def _plans(data: DataFrame, period_start: datetime, period_end: datetime) -> list[LazyFrame]:
+        """Per day aggregates and the peak reading for the billing period."""
+        # Readings are sorted by timestamp, so the period is a contiguous run of rows
+        first_row, end_row = data.select(
+            pl.col(Columns.DATE).search_sorted(period_start.date(), side="left"),
+            pl.col(Columns.DATE).search_sorted(period_end.date(), side="right").alias("end_row"),
+        ).row(0)
+        period_data = data.lazy().slice(first_row, max(end_row - first_row, 0))
+
+        daily_plan = (
             period_data
-            .group_by(pl.col(Columns.TIMESTAMP).dt.date())
+            .select([Columns.DATE, Columns.ENERGY_KWH, Columns.POWER_KW])
+            .group_by(Columns.DATE)
             .agg([
                 pl.sum(Columns.ENERGY_KWH).alias(Columns.TOTAL_ENERGY_KWH),
                 pl.mean(Columns.POWER_KW).alias(Columns.AVG_POWER_KW),
                 pl.max(Columns.POWER_KW).alias(Columns.PEAK_POWER_KW),
             ])
-            .sort(Columns.TIMESTAMP)
+            .sort(Columns.DATE)
+        )
+
+        peak_power_plan = period_data.select(
+            pl.col(Columns.POWER_KW).max(),
+            pl.col(Columns.TIMESTAMP).get(pl.col(Columns.POWER_KW).arg_max()),
         )
 
+        return [daily_plan, peak_power_plan]
+
+    @classmethod
+    def _from_aggregates(
+            cls,
+            bill: BillSummary,
+            period_start: datetime,
+            period_end: datetime,
+            daily_data: DataFrame,
+            peak_power_data: DataFrame,
+    ) -> "BillingPeriodStats":
+        # Right after a meter read the new period has no readings yet
+        if daily_data.is_empty():
+            return cls._unavailable(bill)
+
         # Create list of DailyUsage objects
-        daily_usages = [
-            DailyUsage(
-                date=row[Columns.TIMESTAMP],
-                total_energy_kwh=row[Columns.TOTAL_ENERGY_KWH],
-                avg_power_kw=row[Columns.AVG_POWER_KW],
-                peak_power_kw=row[Columns.PEAK_POWER_KW]
-            )
-            for row in daily_data.iter_rows(named=True)
-        ]
+        daily_usages = _daily_usages(daily_data)
 
-        peak_power_value = period_data.get_column(Columns.POWER_KW).max()
-        peak_power_timestamp = (
-            period_data
-            .filter(pl.col(Columns.POWER_KW) == peak_power_value)
-            .get_column(Columns.TIMESTAMP)
-            .first()
-        )
+        peak_power_value, peak_power_timestamp = peak_power_data.row(0)
 
-        # Find the day with the highest energy usage
-        peak_day_data = (
-            daily_data
-            .filter(
-                pl.col(Columns.TOTAL_ENERGY_KWH) ==
-                daily_data.get_column(Columns.TOTAL_ENERGY_KWH).max()
-            )
-            .row(0, named=True)
-        )
+        total_energy, peak_day_index = daily_data.select(
+            pl.col(Columns.TOTAL_ENERGY_KWH).sum(),
+            pl.col(Columns.TOTAL_ENERGY_KWH).arg_max().alias("peak_day_index"),
+        ).row(0)
 
-        peak_day = DailyUsage(
-            date=peak_day_data[Columns.TIMESTAMP],
-            total_energy_kwh=peak_day_data[Columns.TOTAL_ENERGY_KWH],
-            avg_power_kw=peak_day_data[Columns.AVG_POWER_KW],
-            peak_power_kw=peak_day_data[Columns.PEAK_POWER_KW]
-        )
+        # The first day with the highest energy usage
+        peak_day = daily_usages[peak_day_index]
 
         # Calculate period totals
-        total_energy = daily_data.get_column(Columns.TOTAL_ENERGY_KWH).sum()
         days = len(daily_usages)
         days_in_period = (period_end - period_start).days
 
@@ -283,8 +314,30 @@ class BillingPeriodStats:
             )
         )
 
+    @classmethod
+    def from_dataframe(
+            cls,
+            data: DataFrame,
+            bill: BillSummary,
+    ) -> "BillingPeriodStats":
+        if not bill.previous_bill_period_end:
+            return cls._unavailable(bill)
+
+        period_start, period_end = cls._period(bill)
+        return cls._from_aggregates(
+            bill,
+            period_start,
+            period_end,
+            *pl.collect_all(cls._plans(data, period_start, period_end), streaming=True)
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for HA state attributes."""
+        return self._attributes
+
+    @functools.cached_property
+    def _attributes(self) -> dict[str, Any]:
+        """State attributes, computed once as the stats are frozen."""
         return {
             "start_date": self.start_date.isoformat(),
             "total_energy_kwh": self.total_energy_kwh,
@@ -304,3 +357,60 @@ class BillingPeriodStats:
                 for day in self.daily_usages
             ]
         }
+
+
+def _stats_or_none(name: str, create: Callable[..., Any], *args: Any) -> Any:
+    """Create one sensor's stats, logging and returning None if that fails."""
+    try:
+        return create(*args)
+    except Exception as exception:
+        LOGGER.error("Failed to compute %s stats: %s", name, str(exception))
+        return None
+
+
+@define(frozen=True)
+class UsageStats:
+    """Stats for every usage sensor, computed together from one set of readings."""
+    daily: DailyStats | None
+    weekly: WeeklyAnalysis | None
+    billing_period: BillingPeriodStats | None
+
+    @classmethod
+    def from_dataframe(cls, data: DataFrame, bill: BillSummary) -> "UsageStats":
+        """
+        Create UsageStats from a DataFrame, running all the aggregations in one collect.
+        If that fails each stat is computed on its own, a stat that still fails is left as None
+        so it cannot take the others down with it.
+        """
+        try:
+            return cls._collect_together(data, bill)
+        except Exception as exception:
+            LOGGER.warning("Failed to compute usage stats together, computing them separately: %s", str(exception))
+
+        return cls(
+            daily=_stats_or_none("daily", DailyStats.from_dataframe, data),
+            weekly=_stats_or_none("weekly", WeeklyAnalysis.from_dataframe, data),
+            billing_period=_stats_or_none("billing period", BillingPeriodStats.from_dataframe, data, bill),
+        )
+
+    @classmethod
+    def _collect_together(cls, data: DataFrame, bill: BillSummary) -> "UsageStats":
+        # The latest day is the last row of the weekly aggregates, one group by serves both
+        plans = [WeeklyAnalysis._plan(data)]
+
+        has_billing_period = bool(bill.previous_bill_period_end)
+        if has_billing_period:
+            period_start, period_end = BillingPeriodStats._period(bill)
+            plans.extend(BillingPeriodStats._plans(data, period_start, period_end))
+
+        weekly_daily_data, *billing_frames = pl.collect_all(plans, streaming=True)
+
+        return cls(
+            daily=DailyStats._from_aggregates(weekly_daily_data),
+            weekly=WeeklyAnalysis._from_daily_data(weekly_daily_data),
+            billing_period=(
+                BillingPeriodStats._from_aggregates(bill, period_start, period_end, *billing_frames)
+                if has_billing_period
+                else BillingPeriodStats._unavailable(bill)
+            ),
+        )
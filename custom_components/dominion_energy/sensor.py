@@ -21,19 +21,20 @@ from homeassistant.helpers.device_registry import DeviceInfo, DeviceEntryType
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from polars import DataFrame
 
 from . import DominionEnergyUpdateCoordinator
 from .const import DOMAIN
 from .models import BillSummary
-from .models.attributes import WeeklyAnalysis, DailyStats, BillingPeriodStats
+from .models.attributes import UsageStats
 
 
 @dataclass(frozen=True, kw_only=True)
 class DominionEnergySensorEntityDescription(SensorEntityDescription):
     """Class describing Dominion Energy sensor entities"""
-    value_fn: Callable[[DataFrame, BillSummary | None], StateType]
-    attributes_fn: Callable[[DataFrame, BillSummary | None], dict[str, Any]] | None = None
+    # Picks the sensor's stats out of the coordinator's, passed to value_fn and attributes_fn
+    stats_fn: Callable[[UsageStats], Any] = lambda stats: stats
+    value_fn: Callable[[Any, BillSummary | None], StateType]
+    attributes_fn: Callable[[Any, BillSummary | None], dict[str, Any] | None] | None = None
 
 
 ELECTRICITY_SENSOR_DESCRIPTIONS: tuple[DominionEnergySensorEntityDescription, ...] = (
@@ -45,8 +46,9 @@ ELECTRICITY_SENSOR_DESCRIPTIONS: tuple[DominionEnergySensorEntityDescription, ..
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
         suggested_display_precision=2,
-        value_fn=lambda data, _: DailyStats.from_dataframe(data).usage.total_energy_kwh,
-        attributes_fn=lambda data, _: DailyStats.from_dataframe(data).to_dict()
+        stats_fn=lambda stats: stats.daily,
+        value_fn=lambda stats, _: stats.usage.total_energy_kwh if stats else None,
+        attributes_fn=lambda stats, _: stats.to_dict() if stats else None
     ),
     DominionEnergySensorEntityDescription(
         key="energy_weekly",
@@ -56,10 +58,9 @@ ELECTRICITY_SENSOR_DESCRIPTIONS: tuple[DominionEnergySensorEntityDescription, ..
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         state_class=SensorStateClass.TOTAL,
         suggested_display_precision=2,
-        value_fn=lambda data, _: (
-            WeeklyAnalysis.from_dataframe(data).total_energy_kwh
-        ),
-        attributes_fn=lambda data, _: WeeklyAnalysis.from_dataframe(data).to_dict()
+        stats_fn=lambda stats: stats.weekly,
+        value_fn=lambda stats, _: stats.total_energy_kwh if stats else None,
+        attributes_fn=lambda stats, _: stats.to_dict() if stats else None
     ),
     DominionEnergySensorEntityDescription(
         key="energy_current_period",
@@ -71,8 +72,9 @@ ELECTRICITY_SENSOR_DESCRIPTIONS: tuple[DominionEnergySensorEntityDescription, ..
         suggested_display_precision=2,
         entity_registry_enabled_default=True,
         suggested_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        value_fn=lambda data, bill: BillingPeriodStats.from_dataframe(data, bill).total_energy_kwh,
-        attributes_fn=lambda data, bill: BillingPeriodStats.from_dataframe(data, bill).to_dict()
+        stats_fn=lambda stats: stats.billing_period,
+        value_fn=lambda stats, _: stats.total_energy_kwh if stats else None,
+        attributes_fn=lambda stats, _: stats.to_dict() if stats else None
     ),
 )
 
@@ -89,6 +91,11 @@ BILLING_SENSOR_DESCRIPTIONS: tuple[DominionEnergySensorEntityDescription, ...] =
     ),
 )
 
+SENSOR_DESCRIPTIONS: tuple[DominionEnergySensorEntityDescription, ...] = (
+    ELECTRICITY_SENSOR_DESCRIPTIONS +
+    BILLING_SENSOR_DESCRIPTIONS
+)
+
 async def async_setup_entry(
         hass: HomeAssistant,
         entry: ConfigEntry,
@@ -98,10 +105,6 @@ async def async_setup_entry(
     coordinator: DominionEnergyUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     if coordinator.data is not None:
-        sensor_descriptions = (
-                ELECTRICITY_SENSOR_DESCRIPTIONS +
-                BILLING_SENSOR_DESCRIPTIONS
-        )
         device = DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
             name=f"Dominion Energy Usage for Account {coordinator.bill_summary.account_number}",
@@ -118,7 +121,7 @@ async def async_setup_entry(
                 entry_id=entry.entry_id,
                 bill_summary=coordinator.bill_summary
             )
-            for description in sensor_descriptions
+            for description in SENSOR_DESCRIPTIONS
         ]
         async_add_entities(entities)
 
@@ -153,11 +156,17 @@ class DominionEnergySensor(CoordinatorEntity[DominionEnergyUpdateCoordinator], S
         self._attr_device_info = device
         self._bill_summary = bill_summary
 
+    def _current_stats(self) -> Any:
+        """Stats computed by the coordinator for its latest update."""
+        if self.coordinator.usage_stats is None:
+            return None
+        return self.entity_description.stats_fn(self.coordinator.usage_stats)
+
     @property
     def native_value(self) -> StateType:
         if self.coordinator.data is not None:
             return  self.entity_description.value_fn(
-                self.coordinator.data,
+                self._current_stats(),
                 self._bill_summary
             )
 
@@ -167,7 +176,7 @@ class DominionEnergySensor(CoordinatorEntity[DominionEnergyUpdateCoordinator], S
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
         if self.coordinator.data is not None and self.entity_description.attributes_fn is not None:
             return self.entity_description.attributes_fn(
-                self.coordinator.data,
+                self._current_stats(),
                 self._bill_summary
             )
         return None
\ No newline at end of file